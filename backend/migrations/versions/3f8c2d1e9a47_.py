@@ -0,0 +1,44 @@
+"""add composite indexes for per-user data and project membership lookups
+
+Revision ID: 3f8c2d1e9a47
+Revises: b2a677c0df08
+Create Date: 2026-10-14 03:06:25.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3f8c2d1e9a47"
+down_revision = "b2a677c0df08"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_data_assigned_user_id_project_id_is_marked_for_review",
+        "data",
+        ["assigned_user_id", "project_id", "is_marked_for_review"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_user_project_project_id_user_id",
+        "user_project",
+        ["project_id", "user_id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    # InnoDB drops the implicit foreign key indexes on `data.assigned_user_id`
+    # and `user_project.project_id` once the composite indexes above cover
+    # them, so recreate single-column indexes before dropping the composites
+    # or MySQL refuses with error 1553.
+    op.create_index("project_id", "user_project", ["project_id"], unique=False)
+    op.drop_index("ix_user_project_project_id_user_id", table_name="user_project")
+    op.create_index("assigned_user_id", "data", ["assigned_user_id"], unique=False)
+    op.drop_index(
+        "ix_data_assigned_user_id_project_id_is_marked_for_review", table_name="data"
+    )
@@ -1,7 +1,10 @@
+from sqlalchemy.ext import baked
 from werkzeug.security import generate_password_hash, check_password_hash
 
 from backend import db
 
+bakery = baked.bakery()
+
 annotation_table = db.Table(
     "annotation",
     db.metadata,
@@ -39,6 +42,20 @@ user_project_table = db.Table(
         default=db.func.now(),
         onupdate=db.func.utc_timestamp(),
     ),
+    db.Index("ix_user_project_project_id_user_id", "project_id", "user_id"),
+)
+
+
+# Compiled once and reused by `Project.has_user` on every authorized request
+project_has_user_query = bakery(
+    lambda session: session.query(
+        db.exists().where(
+            db.and_(
+                user_project_table.c.project_id == db.bindparam("project_id"),
+                user_project_table.c.user_id == db.bindparam("user_id"),
+            )
+        )
+    )
 )
 
 
@@ -87,6 +104,15 @@ class Data(db.Model):
     assigned_user = db.relationship("User")
     segmentations = db.relationship("Segmentation", backref="Data")
 
+    __table_args__ = (
+        db.Index(
+            "ix_data_assigned_user_id_project_id_is_marked_for_review",
+            "assigned_user_id",
+            "project_id",
+            "is_marked_for_review",
+        ),
+    )
+
     def update_marked_review(self, marked_review):
         self.is_marked_for_review = marked_review
 
@@ -238,6 +264,17 @@ class Project(db.Model):
     labels = db.relationship("Label", backref="Project")
     creator_user = db.relationship("User")
 
+    def has_user(self, user):
+        # Probe `user_project` directly instead of loading every project user
+        if user is None:
+            return False
+
+        return (
+            project_has_user_query(db.session())
+            .params(project_id=self.id, user_id=user.id)
+            .scalar()
+        )
+
 
 class Role(db.Model):
     __tablename__ = "role"
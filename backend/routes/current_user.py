@@ -50,10 +50,13 @@ def fetch_data_for_project(project_id):
         request_user = User.query.filter_by(username=identity["username"]).first()
         project = Project.query.get(project_id)
 
-        if request_user not in project.users:
+        if not project.has_user(request_user):
             return jsonify(message="Unauthorized access!"), 401
 
-        segmentations = db.session.query(Segmentation.data_id).distinct().subquery()
+        # Correlated EXISTS on `segmentation.data_id` so only this user's data
+        # points are probed, instead of collecting the distinct data ids of
+        # every segmentation in the database
+        has_segmentations = Data.segmentations.any()
 
         data = {}
 
@@ -61,8 +64,7 @@ def fetch_data_for_project(project_id):
             db.session.query(Data)
             .filter(Data.assigned_user_id == request_user.id)
             .filter(Data.project_id == project_id)
-            .filter(Data.id.notin_(segmentations))
-            .distinct()
+            .filter(~has_segmentations)
             .order_by(Data.last_modified.desc())
         )
 
@@ -70,8 +72,7 @@ def fetch_data_for_project(project_id):
             db.session.query(Data)
             .filter(Data.assigned_user_id == request_user.id)
             .filter(Data.project_id == project_id)
-            .filter(Data.id.in_(segmentations))
-            .distinct()
+            .filter(has_segmentations)
             .order_by(Data.last_modified.desc())
         )
 
@@ -89,6 +90,18 @@ def fetch_data_for_project(project_id):
 
         next_page = paginated_data.next_num if paginated_data.has_next else None
         prev_page = paginated_data.prev_num if paginated_data.has_prev else None
+
+        # Count segmentations for the whole page in the database rather than
+        # loading each data point's segmentations (and their transcriptions)
+        data_ids = [data_point.id for data_point in paginated_data.items]
+        segmentation_counts = {}
+        if data_ids:
+            segmentation_counts = dict(
+                db.session.query(Segmentation.data_id, db.func.count(Segmentation.id))
+                .filter(Segmentation.data_id.in_(data_ids))
+                .group_by(Segmentation.data_id)
+            )
+
         response = list(
             [
                 {
@@ -98,7 +111,9 @@ def fetch_data_for_project(project_id):
                     "created_on": data_point.created_at.strftime("%B %d, %Y"),
                     "reference_transcription": data_point.reference_transcription,
                     "is_marked_for_review": data_point.is_marked_for_review,
-                    "number_of_segmentations": len(data_point.segmentations),
+                    "number_of_segmentations": segmentation_counts.get(
+                        data_point.id, 0
+                    ),
                     "youtube_start_time": data_point.youtube_start_time,
                     "youtube_end_time": data_point.youtube_end_time,
                 }
@@ -11,7 +11,7 @@ from werkzeug.utils import secure_filename
 from werkzeug.exceptions import BadRequest, NotFound, InternalServerError
 
 from backend import app, db
-from backend.models import Data, Project, User, Segmentation, Label, LabelValue
+from backend.models import Data, Project, User, Segmentation, Label
 
 from . import api
 
@@ -67,8 +67,18 @@ def generate_segmentation(
 
     values = []
 
+    # Resolve every label of the annotation in one query and key it by name
+    labels = {}
+    if annotations:
+        labels = {
+            label.name: label
+            for label in Label.query.filter(
+                Label.project_id == project_id, Label.name.in_(annotations.keys())
+            )
+        }
+
     for label_name, val in annotations.items():
-        label = Label.query.filter_by(name=label_name, project_id=project_id).first()
+        label = labels.get(label_name)
 
         if label is None:
             raise NotFound(description=f"Label not found with name: `{label_name}`")
@@ -79,13 +89,12 @@ def generate_segmentation(
             )
 
         label_values = val["values"]
+        label_values_by_id = {value.id: value for value in label.label_values}
 
         if isinstance(label_values, list):
             for val_id in label_values:
 
-                value = LabelValue.query.filter_by(
-                    id=int(val_id), label_id=int(label.id)
-                ).first()
+                value = label_values_by_id.get(int(val_id))
 
                 if value is None:
                     raise BadRequest(
@@ -97,9 +106,7 @@ def generate_segmentation(
             if label_values == "-1":
                 continue
 
-            value = LabelValue.query.filter_by(
-                id=int(label_values), label_id=int(label.id)
-            ).first()
+            value = label_values_by_id.get(int(label_values))
 
             if value is None:
                 raise BadRequest(
@@ -220,6 +227,9 @@ def register_dataset():
     youtube_start_times = request.form.getlist("youtube_start_times")
     youtube_end_times = request.form.getlist("youtube_end_times")
 
+    if len(original_filenames) == 0:
+        raise BadRequest(description="No audio filenames provided to register")
+
     if len(original_filenames) != len(uuid_filenames):
         raise BadRequest(description="Number of original filenames and uuid filenames are not equal")
     
@@ -232,6 +242,8 @@ def register_dataset():
     if len(original_filenames) != len(reference_transcriptions):
         raise BadRequest(description="Number of original filenames and reference transcriptions are not equal")
 
+    new_data = []
+
     for original_filename, uuid_filename, youtube_start_time, youtube_end_time, reference_transcription\
         in zip(original_filenames, uuid_filenames, youtube_start_times, youtube_end_times, reference_transcriptions):
         extension = Path(original_filename).suffix.lower()
@@ -239,21 +251,32 @@ def register_dataset():
         if len(extension) > 1 and extension[1:] not in ALLOWED_EXTENSIONS:
             raise BadRequest(description="File format is not supported")
 
-        data = Data(
-            project_id=project.id,
-            filename=uuid_filename,
-            original_filename=original_filename,
-            reference_transcription=reference_transcription,
-            is_marked_for_review=False,
-            assigned_user_id=user.id,
-            youtube_start_time=youtube_start_time,
-            youtube_end_time=youtube_end_time,
+        new_data.append(
+            {
+                "project_id": project.id,
+                "filename": uuid_filename,
+                "original_filename": original_filename,
+                "reference_transcription": reference_transcription,
+                "is_marked_for_review": False,
+                "assigned_user_id": user.id,
+                "youtube_start_time": youtube_start_time,
+                "youtube_end_time": youtube_end_time,
+            }
         )
-        db.session.add(data)
-        db.session.flush()
 
+    # One parameterized INSERT executed for every row (executemany) and a
+    # single commit, instead of an ORM round trip per row
+    try:
+        db.session.bulk_insert_mappings(Data, new_data)
         db.session.commit()
-        db.session.refresh(data)
+    except sa.exc.IntegrityError as e:
+        app.logger.info("Dataset contains filenames that already exist")
+        app.logger.info(e)
+        raise BadRequest(description="One or more uuid filenames already exist")
+
+    # `filename` is unique, so this recovers the id without `return_defaults=True`
+    # (which would turn the executemany back into one INSERT per row)
+    data = Data.query.filter_by(filename=new_data[-1]["filename"]).first()
 
     return (
         jsonify(
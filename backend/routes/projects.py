@@ -163,19 +163,35 @@ def update_project_users(project_id):
             400,
         )
 
+    # Compare against `User.id` as ints rather than whatever the client sent.
+    # Only accept real ints or digit strings: `int()` would also take `true`
+    # or `3.7` and silently map them onto the wrong user.
+    if not all(
+        type(user_id) == int
+        or (isinstance(user_id, str) and user_id.isascii() and user_id.isdigit())
+        for user_id in users
+    ):
+        return (
+            jsonify(
+                message="Params `user` should be a list of user ids",
+                type="INVALID_USERS",
+            ),
+            400,
+        )
+
+    users = [int(user_id) for user_id in users]
+
     try:
         project = Project.query.get(project_id)
         # TODO: Decide whether to give creator of project access
         # project.users.append(request_user)
-        final_users = [user for user in project.users]
-        for user in project.users:
-            if user.id not in users:
-                final_users.remove(user)
+        user_ids = set(users)
+        final_users = [user for user in project.users if user.id in user_ids]
 
-        for user_id in users:
-            user = User.query.get(user_id)
-            if user not in project.users:
-                final_users.append(user)
+        # Fetch all newly assigned users in a single IN query
+        new_user_ids = user_ids - {user.id for user in final_users}
+        if new_user_ids:
+            final_users.extend(User.query.filter(User.id.in_(new_user_ids)).all())
 
         project.users = final_users
 
@@ -387,7 +403,7 @@ def get_labels_for_project(project_id):
         request_user = User.query.filter_by(username=identity["username"]).first()
         project = Project.query.get(project_id)
 
-        if request_user not in project.users:
+        if not project.has_user(request_user):
             return jsonify(message="Unauthorized access!"), 401
 
         labels = project.labels
@@ -422,7 +438,7 @@ def get_segmentations_for_data(project_id, data_id):
         request_user = User.query.filter_by(username=identity["username"]).first()
         project = Project.query.get(project_id)
 
-        if request_user not in project.users:
+        if not project.has_user(request_user):
             return jsonify(message="Unauthorized access!"), 401
 
         data = Data.query.filter_by(id=data_id, project_id=project_id).first()
@@ -438,18 +454,19 @@ def get_segmentations_for_data(project_id, data_id):
 
             values = dict()
             for value in segment.values:
-                if value.label.name not in values:
-                    values[value.label.name] = {
-                        "label_id": value.label.id,
-                        "values": []
-                        if value.label.label_type.type == "multiselect"
-                        else None,
+                label = value.label
+                is_multiselect = label.label_type.type == "multiselect"
+
+                if label.name not in values:
+                    values[label.name] = {
+                        "label_id": label.id,
+                        "values": [] if is_multiselect else None,
                     }
 
-                if value.label.label_type.type == "multiselect":
-                    values[value.label.name]["values"].append(value.id)
+                if is_multiselect:
+                    values[label.name]["values"].append(value.id)
                 else:
-                    values[value.label.name]["values"] = value.id
+                    values[label.name]["values"] = value.id
 
             resp["annotations"] = values
 
@@ -485,7 +502,7 @@ def update_data(project_id, data_id):
         request_user = User.query.filter_by(username=identity["username"]).first()
         project = Project.query.get(project_id)
 
-        if request_user not in project.users:
+        if not project.has_user(request_user):
             return jsonify(message="Unauthorized access!"), 401
 
         data = Data.query.filter_by(id=data_id, project_id=project_id).first()
@@ -555,7 +572,7 @@ def add_segmentations(project_id, data_id, segmentation_id=None):
         request_user = User.query.filter_by(username=identity["username"]).first()
         project = Project.query.get(project_id)
 
-        if request_user not in project.users:
+        if not project.has_user(request_user):
             return jsonify(message="Unauthorized access!"), 401
 
         data = Data.query.filter_by(id=data_id, project_id=project_id).first()
@@ -614,7 +631,7 @@ def delete_segmentations(project_id, data_id, segmentation_id):
         request_user = User.query.filter_by(username=identity["username"]).first()
         project = Project.query.get(project_id)
 
-        if request_user not in project.users:
+        if not project.has_user(request_user):
             return jsonify(message="Unauthorized access!"), 401
 
         data = Data.query.filter_by(id=data_id, project_id=project_id).first()
@@ -655,15 +672,32 @@ def get_project_annotations(project_id):
     identity = get_jwt_identity()
 
     try:
-        # TODO: Check if this can be optimized
         request_user = User.query.filter_by(username=identity["username"]).first()
-        project = Project.query.options(
-            joinedload(Project.data).joinedload(Data.segmentations).joinedload(Segmentation.values)
-        ).get(project_id)
+        project = Project.query.get(project_id)
 
-        if request_user not in project.users:
+        if not project.has_user(request_user):
             return jsonify(message="Unauthorized access!"), 401
 
+        # Only once authorized, eagerly load everything `to_dict` and the
+        # annotation loop touch so the export doesn't issue a query per data
+        # point, user and label. `populate_existing` applies the eager loads to
+        # the project instance already in the session.
+        project = (
+            Project.query.options(
+                joinedload(Project.data)
+                .joinedload(Data.assigned_user)
+                .joinedload(User.role),
+                joinedload(Project.data)
+                .joinedload(Data.segmentations)
+                .joinedload(Segmentation.values)
+                .joinedload(LabelValue.label)
+                .joinedload(Label.label_type),
+            )
+            .populate_existing()
+            .filter(Project.id == project_id)
+            .one()
+        )
+
         annotations = []
 
         for data in project.data:
@@ -675,20 +709,21 @@ def get_project_annotations(project_id):
 
                 values = dict()
                 for value in segmentation.values:
-                    if value.label.name not in values:
-                        values[value.label.name] = {
-                            "id": value.label.id,
-                            "values": []
-                            if value.label.label_type.type == "multiselect"
-                            else None,
+                    label = value.label
+                    is_multiselect = label.label_type.type == "multiselect"
+
+                    if label.name not in values:
+                        values[label.name] = {
+                            "id": label.id,
+                            "values": [] if is_multiselect else None,
                         }
 
-                    if value.label.label_type.type == "multiselect":
-                        values[value.label.name]["values"].append(
+                    if is_multiselect:
+                        values[label.name]["values"].append(
                             {"id": value.id, "value": value.value}
                         )
                     else:
-                        values[value.label.name]["values"] = {
+                        values[label.name]["values"] = {
                             "id": value.id,
                             "value": value.value,
                         }
@@ -123,7 +123,9 @@ def update_user(user_id):
         )
 
     try:
-        users = db.session.query(User).filter_by(role_id=1).all()
+        # Only need to know whether more than one admin exists, so don't
+        # materialize every admin row
+        users = db.session.query(User).filter_by(role_id=1).limit(2).all()
 
         if len(users) == 1 and users[0].id == user_id and role_id == 2:
             return jsonify(message="Atleast one admin should exist"), 400
@@ -17,10 +17,11 @@ max_retries = args.max_retries
 poll_seconds = args.poll_seconds
 
 
+engine = create_engine(os.getenv("DATABASE_URL"), pool_pre_ping=True)
+
 retry = 0
 while retry < max_retries:
     try:
-        engine = create_engine(os.getenv("DATABASE_URL"), pool_pre_ping=True)
         conn = engine.connect()
         conn.execute('SELECT 1')
         break